@@ -1,18 +1,33 @@
 #!/usr/bin/env python3
 """
 Script to convert Parquet files to SQLite database.
-Handles large datasets using Dask and implements proper logging.
+
+Streams Arrow record batches from a pyarrow.dataset scan (threaded
+decode, prefetched on a reader thread) into sqlite3 inside a single
+tuned transaction, with opt-in ADBC, CSV .import and multi-process
+row-group ingest modes. Handles datasets larger than memory: only a
+few batches are ever in flight.
 """
 
 import argparse
 import logging
+import queue
+import shutil
+import subprocess
 import sys
+import tempfile
+import threading
 import psutil
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, NoReturn, Iterator, Tuple
 
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.fs
 import pyarrow.parquet as pq
 import sqlite3
 from sqlite3 import Connection
@@ -28,16 +43,29 @@ class ParquetToSQLiteConverter:
         output_file (Path): Path to the output SQLite database
         logger (logging.Logger): Logger instance for the class
         chunk_size (int): Size of chunks to process at once
-        index_column (Optional[str]): Column name to create index on
+        index_column (Optional[str]): Column name to create index on.
+            Indices (including pre-existing ones on re-runs) are created
+            only after all rows are loaded, never during the ingest.
     """
 
+    # Batches below this lose an order of magnitude on bulk-load throughput
+    MIN_CHUNK_SIZE = 16384
+
+    # Flush progress to the bar once per this many chunks
+    PBAR_REFRESH_CHUNKS = 8
+
     def __init__(
             self,
             input_file: Path,
             output_file: Path,
-            chunk_size: int = 10000,  # Reduced default chunk size
+            chunk_size: int = 65536,
             log_level: int = logging.INFO,
-            index_column: Optional[str] = None
+            index_column: Optional[str] = None,
+            use_adbc: bool = False,
+            columns: Optional[list] = None,
+            fast_csv: bool = False,
+            integer_pk: bool = False,
+            workers: int = 1
     ) -> None:
         """
         Initialize the converter with input and output paths.
@@ -48,12 +76,38 @@ class ParquetToSQLiteConverter:
             chunk_size: Number of rows to process at once
             log_level: Logging level to use
             index_column: Column name to create index on
+            use_adbc: Ingest through the ADBC SQLite driver when installed
+            columns: Subset of columns to load; None loads all columns
+            fast_csv: Bulk load through the sqlite3 shell's CSV importer
+            integer_pk: Declare an integer index_column as INTEGER PRIMARY
+                KEY on a WITHOUT ROWID table; requires unique values
+            workers: Number of processes to split the ingest across; each
+                ingests a share of row groups into its own part database,
+                merged at the end
         """
         self.input_file = input_file
         self.output_file = output_file
         self.chunk_size = chunk_size
         self.index_column = index_column
+        self.use_adbc = use_adbc
+        self.columns = columns
+        self.fast_csv = fast_csv
+        self.integer_pk = integer_pk
+        self.workers = workers
         self.logger = self._setup_logger(log_level)
+        self._register_numpy_adapters()
+
+        # Source dataset handle and metadata, opened once per conversion so
+        # the Parquet footer is not reparsed by every code path
+        self._dataset: Optional[ds.Dataset] = None
+        self._schema: Optional[pa.Schema] = None
+        self._total_rows: Optional[int] = None
+
+        # Multi-row INSERT statements cached per rows-per-statement count
+        self._packed_sql_cache: dict = {}
+
+        # Set when the table was created with index_column as PRIMARY KEY
+        self._pk_applied: Optional[str] = None
 
     def _get_memory_usage(self) -> float:
         """
@@ -65,25 +119,17 @@ class ParquetToSQLiteConverter:
         process = psutil.Process(os.getpid())
         return process.memory_info().rss / 1024 / 1024  # Convert to MB
 
-    def _adjust_chunk_size(self, total_rows: int) -> None:
+    def _adjust_chunk_size(self) -> None:
         """
-        Adjust chunk size based on available system memory.
+        Clamp chunk size to the bulk-load floor.
 
-        Args:
-            total_rows: Total number of rows in the dataset
+        Small batches dominate bulk-load cost, and pyarrow streams one batch
+        at a time so per-chunk memory is roughly constant regardless of
+        chunk size; there is no reason to shrink below the floor.
         """
-        available_memory = psutil.virtual_memory().available / 1024 / 1024  # MB
-        current_memory = self._get_memory_usage()
-
-        # Target using no more than 75% of available memory
-        target_memory = available_memory * 0.75
-
-        # If we're already using too much memory, reduce chunk size
-        if current_memory > target_memory / 2:
-            self.chunk_size = max(1000, self.chunk_size // 2)
-            self.logger.info(f"Reduced chunk size to {self.chunk_size} due to memory constraints")
-
-        self.logger.debug(f"Available memory: {available_memory:.2f}MB, Current usage: {current_memory:.2f}MB")
+        if self.chunk_size < self.MIN_CHUNK_SIZE:
+            self.chunk_size = self.MIN_CHUNK_SIZE
+            self.logger.info(f"Raised chunk size to the {self.MIN_CHUNK_SIZE} bulk-load floor")
 
     def _setup_logger(self, log_level: int) -> logging.Logger:
         """
@@ -98,13 +144,18 @@ class ParquetToSQLiteConverter:
         logger = logging.getLogger(__name__)
         logger.setLevel(log_level)
 
-        # Create console handler with formatting
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # The logger is a module-wide singleton: only attach the console
+        # handler once, or every converter instance would duplicate output
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+
+        # Avoid double emission when the root logger is configured too
+        logger.propagate = False
 
         return logger
 
@@ -119,13 +170,89 @@ class ParquetToSQLiteConverter:
             sqlite3.Error: If connection cannot be established
         """
         try:
-            conn = sqlite3.connect(str(self.output_file))
+            # isolation_level=None disables the implicit transaction handling
+            # of the sqlite3 module so we can manage one explicit transaction
+            # for the whole ingest instead of paying an fsync per chunk.
+            conn = sqlite3.connect(str(self.output_file), isolation_level=None)
+            self._apply_pragmas(conn)
             self.logger.debug("SQLite connection established")
             return conn
         except sqlite3.Error as e:
             self.logger.error(f"Failed to connect to SQLite database: {e}")
             raise
 
+    def _apply_pragmas(self, conn: Connection) -> None:
+        """
+        Apply PRAGMA settings tuned for bulk loading.
+
+        Args:
+            conn: SQLite database connection
+        """
+        pragmas = [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA cache_size=-262144",
+            "PRAGMA locking_mode=EXCLUSIVE",
+            "PRAGMA mmap_size=30000000000",
+        ]
+        for pragma in pragmas:
+            conn.execute(pragma)
+        self.logger.debug("Bulk-load PRAGMAs applied")
+
+    def _drop_existing_indices(self, conn: Connection) -> list:
+        """
+        Drop any pre-existing indices on data_table before bulk loading.
+
+        Inserting into an indexed table pays B-tree maintenance per row, so
+        on re-runs we drop the indices up front and recreate them once all
+        rows are loaded.
+
+        Args:
+            conn: SQLite database connection
+
+        Returns:
+            List of CREATE INDEX statements to replay after the load
+        """
+        rows = conn.execute(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = 'data_table' AND sql IS NOT NULL"
+        ).fetchall()
+
+        index_ddl = []
+        for name, ddl in rows:
+            self.logger.debug(f"Dropping index {name} for bulk load")
+            conn.execute(f'DROP INDEX IF EXISTS {name}')
+            index_ddl.append(ddl)
+
+        if index_ddl:
+            self.logger.info(f"Dropped {len(index_ddl)} existing indices for bulk load")
+
+        return index_ddl
+
+    def _restore_indices(self, conn: Connection, index_ddl: list) -> None:
+        """
+        Recreate indices that were dropped before the bulk load.
+
+        The stashed DDL comes from the previous table, whose column set may
+        differ from the one just loaded (e.g. a narrower --columns
+        selection), so statements that no longer apply are skipped with a
+        warning instead of failing the whole ingest transaction.
+
+        Args:
+            conn: SQLite database connection
+            index_ddl: CREATE INDEX statements stashed by _drop_existing_indices
+        """
+        restored = 0
+        for ddl in index_ddl:
+            try:
+                conn.execute(ddl)
+                restored += 1
+            except sqlite3.OperationalError as index_error:
+                self.logger.warning(f"Skipping stale index DDL ({index_error}): {ddl}")
+        if restored:
+            self.logger.info(f"Restored {restored} indices after bulk load")
+
     def _create_indices(self, conn: Connection) -> None:
         """
         Create necessary indices on the SQLite database.
@@ -140,6 +267,12 @@ class ParquetToSQLiteConverter:
             self.logger.info("No index column specified, skipping index creation")
             return
 
+        if self._pk_applied == self.index_column:
+            self.logger.info(
+                f"{self.index_column} is the table's primary key, no separate index needed"
+            )
+            return
+
         try:
             self.logger.info(f"Creating index on {self.index_column} column...")
             # Use parameterized identifier
@@ -148,29 +281,485 @@ class ParquetToSQLiteConverter:
             # but since we're using the column name from the DataFrame,
             # it's already validated as a valid column name
             conn.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON data_table({self.index_column})')
-            conn.commit()
             self.logger.info("Index created successfully")
         except sqlite3.Error as e:
             self.logger.error(f"Failed to create index: {e}")
             raise
 
-    def _read_parquet_chunks(self) -> Iterator[Tuple[pd.DataFrame, int]]:
+    def _open_dataset(self) -> ds.Dataset:
+        """
+        Open the source dataset once and cache it with its metadata.
+
+        Scanning goes through pyarrow.dataset: decode runs on a CPU-count
+        thread pool and readahead overlaps I/O with decompression, unlike
+        the sequential single-threaded ParquetFile.iter_batches. Caching the
+        handle means the Parquet footer is parsed once, and schema and row
+        count are available to every code path without re-reading it.
+
+        Returns:
+            The cached pyarrow Dataset for the input file
+        """
+        if self._dataset is None:
+            # Memory-mapped reads let the kernel page data in lazily with
+            # readahead, and pre_buffer coalesces the small column-chunk
+            # reads within each row group into larger I/O requests
+            parquet_format = ds.ParquetFileFormat(
+                default_fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=True)
+            )
+            self._dataset = ds.dataset(
+                str(self.input_file.resolve()),
+                format=parquet_format,
+                filesystem=pyarrow.fs.LocalFileSystem(use_mmap=True)
+            )
+            self._schema = self._dataset.schema
+            self._total_rows = self._dataset.count_rows()
+        return self._dataset
+
+    def _projected_schema(self) -> pa.Schema:
+        """
+        Return the Arrow schema of the columns actually being loaded.
+
+        Returns:
+            The dataset schema, restricted to self.columns when set
+        """
+        self._open_dataset()
+        if self.columns is None:
+            return self._schema
+        return pa.schema([self._schema.field(name) for name in self.columns])
+
+    @staticmethod
+    def _sqlite_type(arrow_type: pa.DataType) -> str:
+        """
+        Map an Arrow type to a SQLite column affinity.
+
+        Args:
+            arrow_type: Arrow data type of a column
+
+        Returns:
+            SQLite type name for the CREATE TABLE statement
+        """
+        if pa.types.is_integer(arrow_type) or pa.types.is_boolean(arrow_type):
+            return 'INTEGER'
+        if pa.types.is_floating(arrow_type):
+            return 'REAL'
+        if pa.types.is_binary(arrow_type) or pa.types.is_large_binary(arrow_type):
+            return 'BLOB'
+        return 'TEXT'
+
+    def _primary_key_column(self, schema: pa.Schema) -> Optional[str]:
+        """
+        Decide whether index_column can become an INTEGER PRIMARY KEY.
+
+        Args:
+            schema: Arrow schema of the columns being loaded
+
+        Returns:
+            The column name to promote, or None when not applicable
+        """
+        if not (self.integer_pk and self.index_column):
+            return None
+        if self.index_column not in schema.names:
+            self.logger.warning(
+                f"integer_pk requested but {self.index_column} is not in the loaded columns"
+            )
+            return None
+        if not pa.types.is_integer(schema.field(self.index_column).type):
+            self.logger.warning(
+                f"integer_pk requested but {self.index_column} is not integer-typed"
+            )
+            return None
+        return self.index_column
+
+    def _create_table_from_schema(self, conn: Connection, schema: pa.Schema) -> None:
+        """
+        Create data_table from the Arrow schema, replacing any existing one.
+
+        With integer_pk enabled and an integer-typed index_column, the
+        column is declared INTEGER PRIMARY KEY and the table is created
+        WITHOUT ROWID: same rows, fewer bytes per row and better B-tree
+        fanout for lookups on that column. The values must then be unique,
+        which is why the layout stays opt-in.
+
+        Args:
+            conn: SQLite database connection
+            schema: Arrow schema of the columns being loaded
+        """
+        pk_column = self._primary_key_column(schema)
+        columns_ddl = ",".join(
+            f'"{field.name}" INTEGER PRIMARY KEY' if field.name == pk_column
+            else f'"{field.name}" {self._sqlite_type(field.type)}'
+            for field in schema
+        )
+        table_suffix = ' WITHOUT ROWID' if pk_column else ''
+        conn.execute('DROP TABLE IF EXISTS data_table')
+        conn.execute(f'CREATE TABLE data_table ({columns_ddl}){table_suffix}')
+        self._pk_applied = pk_column
+        self.logger.debug(f"Created data_table with columns: {columns_ddl}{table_suffix}")
+
+    def _read_parquet_chunks(self) -> Iterator[Tuple[pa.RecordBatch, int]]:
         """
         Read parquet file in chunks using pyarrow.
 
         Yields:
-            Tuple of (DataFrame chunk, total number of rows)
+            Tuple of (RecordBatch chunk, total number of rows)
+        """
+        dataset = self._open_dataset()
+        total_rows = self._total_rows
+
+        # Create iterator once and use it throughout; Parquet is columnar,
+        # so projecting columns here skips their decompression entirely
+        batch_iterator = dataset.to_batches(
+            batch_size=self.chunk_size,
+            columns=self.columns,
+            use_threads=True,
+            batch_readahead=8,
+            fragment_readahead=2
+        )
+
+        for chunk in batch_iterator:
+            yield chunk, total_rows
+
+    def _prefetch_chunks(self) -> Iterator[Tuple[pa.RecordBatch, int]]:
+        """
+        Run the Parquet reader on a background thread.
+
+        Both pyarrow decode and sqlite3 inserts release the GIL, so reading
+        the next batch overlaps with inserting the current one. The queue is
+        bounded to keep at most a few batches in flight. If the consumer
+        abandons the iteration (e.g. an insert error), the producer is told
+        to stop via an event it checks around every put, so a failed
+        conversion cannot leak a blocked thread pinning Arrow buffers.
+
+        Yields:
+            Tuple of (RecordBatch chunk, total number of rows)
+        """
+        chunk_queue: queue.Queue = queue.Queue(maxsize=4)
+        stop_event = threading.Event()
+
+        def offer(item) -> bool:
+            """Put onto the queue unless the consumer has stopped."""
+            while not stop_event.is_set():
+                try:
+                    chunk_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def producer() -> None:
+            try:
+                for item in self._read_parquet_chunks():
+                    if not offer(item):
+                        return
+            except Exception as read_error:
+                offer(read_error)
+            else:
+                offer(None)
+
+        reader = threading.Thread(target=producer, name="parquet-reader", daemon=True)
+        reader.start()
+
+        try:
+            while True:
+                item = chunk_queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop_event.set()
+            reader.join()
+
+    def _load_adbc(self):
+        """
+        Import the ADBC SQLite DBAPI module if available.
+
+        Returns:
+            The adbc_driver_sqlite.dbapi module, or None when not installed
+        """
+        try:
+            from adbc_driver_sqlite import dbapi
+            return dbapi
+        except ImportError:
+            self.logger.warning(
+                "use_adbc requested but adbc_driver_sqlite is not installed; "
+                "falling back to the executemany path"
+            )
+            return None
+
+    def _convert_via_adbc(self, adbc_dbapi) -> None:
+        """
+        Ingest all Arrow batches through the ADBC SQLite driver.
+
+        ADBC binds Arrow buffers at the C level, skipping the per-value
+        Python boxing the executemany path pays.
+
+        Args:
+            adbc_dbapi: The adbc_driver_sqlite.dbapi module
+        """
+        chunks_iterator = self._prefetch_chunks()
+        first_batch, total_rows = next(chunks_iterator)
+
+        self.logger.info(f"Found {total_rows:,} rows in Parquet file")
+
+        with adbc_dbapi.connect(str(self.output_file)) as conn:
+            with conn.cursor() as cursor:
+                cursor.adbc_ingest('data_table', first_batch, mode='replace')
+                with tqdm(total=total_rows, initial=first_batch.num_rows) as pbar:
+                    del first_batch
+                    for batch, _ in chunks_iterator:
+                        cursor.adbc_ingest('data_table', batch, mode='append')
+                        pbar.update(batch.num_rows)
+            conn.commit()
+
+    def _convert_parallel(self) -> bool:
+        """
+        Ingest row groups in parallel processes and merge the results.
+
+        A single SQLite writer serializes on the WAL append, so for very
+        large files the row groups are split across worker processes, each
+        writing its own part database with the usual single-writer fast
+        path. The parts are then ATTACHed to the final database and merged
+        with INSERT ... SELECT, and indices are built once at the end.
+
+        Returns:
+            True when the conversion was handled here; False for files
+            without row groups, which the single-writer path handles fine
         """
-        # Open parquet file
         parquet_file = pq.ParquetFile(str(self.input_file))
+        num_row_groups = parquet_file.metadata.num_row_groups
         total_rows = parquet_file.metadata.num_rows
+        del parquet_file
 
-        # Create iterator once and use it throughout
-        batch_iterator = parquet_file.iter_batches(batch_size=self.chunk_size)
+        if num_row_groups == 0:
+            self.logger.info("No row groups to split, using the single-writer path")
+            return False
 
-        for chunk in batch_iterator:
-            df_chunk = chunk.to_pandas()
-            yield df_chunk, total_rows
+        self.logger.info(f"Found {total_rows:,} rows in Parquet file")
+
+        workers = min(self.workers, num_row_groups)
+        bounds = [num_row_groups * k // workers for k in range(workers + 1)]
+        assignments = [
+            list(range(bounds[k], bounds[k + 1])) for k in range(workers)
+        ]
+        part_files = [f"{self.output_file}.part{k}.db" for k in range(workers)]
+
+        self.logger.info(
+            f"Ingesting {num_row_groups} row groups across {workers} workers"
+        )
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _ingest_row_groups,
+                        str(self.input_file),
+                        part_files[k],
+                        assignments[k],
+                        self.chunk_size,
+                        self.columns
+                    )
+                    for k in range(workers)
+                ]
+                with tqdm(total=total_rows) as pbar:
+                    for future in as_completed(futures):
+                        pbar.update(future.result())
+
+            # Merge the parts. The table must be created before the parts
+            # are attached: DDL on the main database inside the merge
+            # transaction makes the attached schemas unreadable, and ATTACH
+            # itself is not allowed within a transaction anyway.
+            conn = self._create_sqlite_connection()
+            try:
+                schema = self._projected_schema()
+                quoted_columns = ",".join(f'"{name}"' for name in schema.names)
+
+                # Stash index DDL before the table is replaced so re-runs
+                # keep user indices, matching the single-writer path
+                dropped_index_ddl = self._drop_existing_indices(conn)
+
+                self._create_table_from_schema(conn, schema)
+                for k, part_file in enumerate(part_files):
+                    conn.execute(f'ATTACH DATABASE ? AS part{k}', (part_file,))
+
+                conn.execute("BEGIN")
+                for k in range(workers):
+                    conn.execute(
+                        f'INSERT INTO data_table ({quoted_columns}) '
+                        f'SELECT {quoted_columns} FROM part{k}.data_table'
+                    )
+                self._restore_indices(conn, dropped_index_ddl)
+                self._create_indices(conn)
+                conn.commit()
+
+                for k in range(workers):
+                    conn.execute(f'DETACH DATABASE part{k}')
+            finally:
+                conn.close()
+        finally:
+            for part_file in part_files:
+                if os.path.exists(part_file):
+                    os.unlink(part_file)
+
+        return True
+
+    def _convert_via_csv(self) -> None:
+        """
+        Bulk load through SQLite's own CSV importer.
+
+        For wide, clean datasets the sqlite3 shell's .import beats any
+        INSERT path. Batches are streamed into a temporary CSV file and
+        imported in one shot; the table is created beforehand from the
+        Arrow schema so column affinities are preserved.
+
+        CSV has no NULL representation: .import would store every NULL as
+        an empty string '', silently diverging from the other paths (which
+        store real NULLs) for IS NULL queries and column affinity. Batches
+        are therefore checked while streaming and NULLs are rejected.
+
+        Raises:
+            RuntimeError: If the sqlite3 command-line shell is not on PATH
+            ValueError: If a column contains NULLs, which .import would
+                corrupt into empty strings
+        """
+        if shutil.which('sqlite3') is None:
+            raise RuntimeError(
+                "fast_csv requires the sqlite3 command-line shell on PATH"
+            )
+
+        schema = self._projected_schema()
+        total_rows = self._total_rows
+        self.logger.info(f"Found {total_rows:,} rows in Parquet file")
+
+        # Create the table up front; .import appends into an existing table
+        conn = self._create_sqlite_connection()
+        try:
+            self._create_table_from_schema(conn, schema)
+            conn.commit()
+        finally:
+            conn.close()
+
+        csv_file = tempfile.NamedTemporaryFile(suffix='.csv', delete=False)
+        try:
+            with pacsv.CSVWriter(csv_file, schema) as writer:
+                with tqdm(total=total_rows) as pbar:
+                    for batch, _ in self._prefetch_chunks():
+                        for name, column in zip(batch.schema.names, batch.columns):
+                            if column.null_count:
+                                raise ValueError(
+                                    f"fast_csv cannot represent NULLs: column "
+                                    f"'{name}' has {column.null_count} null "
+                                    f"values in this batch; use the default path"
+                                )
+                        writer.write(batch)
+                        pbar.update(batch.num_rows)
+            csv_file.close()
+
+            self.logger.info("Importing CSV through the sqlite3 shell...")
+            subprocess.run(
+                [
+                    'sqlite3', str(self.output_file),
+                    '.mode csv',
+                    f'.import --skip 1 {csv_file.name} data_table'
+                ],
+                check=True
+            )
+        finally:
+            csv_file.close()
+            os.unlink(csv_file.name)
+
+    @staticmethod
+    def _register_numpy_adapters() -> None:
+        """
+        Teach sqlite3 to bind numpy scalars directly.
+
+        Lets the numeric fast path in _batch_rows hand numpy scalars to
+        SQLite without pre-converting whole columns to Python objects.
+        """
+        for numpy_type in (np.int8, np.int16, np.int32, np.int64,
+                           np.uint8, np.uint16, np.uint32, np.uint64):
+            sqlite3.register_adapter(numpy_type, int)
+        for numpy_type in (np.float32, np.float64):
+            sqlite3.register_adapter(numpy_type, float)
+
+    @staticmethod
+    def _batch_rows(batch: pa.RecordBatch) -> Iterator[tuple]:
+        """
+        Iterate a RecordBatch as row tuples suitable for the insert path.
+
+        Numeric columns without nulls are taken as numpy arrays — zero-copy
+        views over the Arrow buffers — and zip then yields numpy scalars,
+        which sqlite3 binds through the registered adapters. That skips the
+        per-value Python boxing to_pylist pays. Columns with nulls or
+        non-numeric types fall back to to_pylist (a nullable int column
+        would otherwise surface as floats with NaN).
+
+        Args:
+            batch: Arrow record batch to iterate
+
+        Returns:
+            Iterator of row tuples in column order
+        """
+        columns = []
+        for column in batch.columns:
+            if column.null_count == 0 and (
+                    pa.types.is_integer(column.type) or pa.types.is_floating(column.type)
+            ):
+                columns.append(column.to_numpy(zero_copy_only=False))
+            else:
+                columns.append(column.to_pylist())
+        return zip(*columns)
+
+    @staticmethod
+    def _variable_limit(conn: Connection) -> int:
+        """
+        Return SQLite's bound-variable limit for this connection.
+
+        Args:
+            conn: SQLite database connection
+
+        Returns:
+            SQLITE_MAX_VARIABLE_NUMBER (999 on Pythons without getlimit)
+        """
+        try:
+            return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        except AttributeError:  # Python < 3.11
+            return 999
+
+    def _bulk_insert(self, cursor: sqlite3.Cursor, insert_sql: str, batch: pa.RecordBatch) -> None:
+        """
+        Insert one RecordBatch using multi-row VALUES statements.
+
+        Single seam for the batch-insert implementation. The truly C-level
+        route — binding Arrow buffers straight onto a prepared sqlite3_stmt
+        without boxing values into Python objects — is what the ADBC path
+        does (see _convert_via_adbc). This fallback unrolls the insert loop
+        instead: as many rows as fit under SQLite's bound-variable limit
+        are packed into one INSERT ... VALUES (...),(...),... statement,
+        minimizing per-statement prepare/step overhead. Statements are
+        cached per group size, so only the first batch and the trailing
+        partial group ever build a new SQL string.
+
+        Args:
+            cursor: Reused cursor holding the cached prepared statements
+            insert_sql: Single-row INSERT built once from the Arrow schema
+            batch: Arrow record batch to insert
+        """
+        n_cols = batch.num_columns
+        rows_per_stmt = max(1, self._variable_limit(cursor.connection) // n_cols)
+        values_group = "(" + ",".join("?" * n_cols) + ")"
+
+        rows = list(self._batch_rows(batch))
+        for start in range(0, len(rows), rows_per_stmt):
+            group = rows[start:start + rows_per_stmt]
+            sql = self._packed_sql_cache.get(len(group))
+            if sql is None:
+                # insert_sql already ends with one VALUES group
+                sql = insert_sql + ("," + values_group) * (len(group) - 1)
+                self._packed_sql_cache[len(group)] = sql
+            flat = [value for row in group for value in row]
+            cursor.execute(sql, flat)
 
     def convert(self) -> None:
         """
@@ -192,53 +781,113 @@ class ParquetToSQLiteConverter:
             if not self.input_file.exists():
                 raise FileNotFoundError(f"Input file not found: {self.input_file}")
 
+            # Multi-process mode: split row groups across workers and merge
+            # their part databases (index creation happens in the merge);
+            # files without row groups fall through to the single writer
+            if self.workers > 1 and self._convert_parallel():
+                self.logger.info("Conversion completed successfully")
+                return
+
+            # Optional fast paths: CSV .import or ADBC ingest; both finish
+            # by building indices over a plain sqlite3 connection
+            fast_path = None
+            if self.fast_csv:
+                fast_path = self._convert_via_csv
+            elif self.use_adbc:
+                adbc_dbapi = self._load_adbc()
+                if adbc_dbapi is not None:
+                    fast_path = lambda: self._convert_via_adbc(adbc_dbapi)
+            if fast_path is not None:
+                # Stash index DDL before the ingest replaces the table so
+                # re-runs keep user indices, matching the single-writer path
+                conn = self._create_sqlite_connection()
+                dropped_index_ddl = self._drop_existing_indices(conn)
+                conn.close()
+                conn = None
+
+                fast_path()
+
+                conn = self._create_sqlite_connection()
+                conn.execute("BEGIN")
+                self._restore_indices(conn, dropped_index_ddl)
+                self._create_indices(conn)
+                conn.commit()
+                self.logger.info("Conversion completed successfully")
+                return
+
             # Create SQLite connection
             conn = self._create_sqlite_connection()
 
             # Process chunks
-            first_chunk = True
-            chunks_iterator = self._read_parquet_chunks()
-            first_df, total_rows = next(chunks_iterator)
+            self._adjust_chunk_size()
+            schema = self._projected_schema()
+            total_rows = self._total_rows
 
             self.logger.info(f"Found {total_rows:,} rows in Parquet file")
-            self._adjust_chunk_size(total_rows)
 
-            # Create table with first chunk
-            first_df.to_sql('data_table', conn, if_exists='replace', index=False)
-            del first_df
+            # Run the whole ingest (and index creation) inside one explicit
+            # transaction so SQLite fsyncs once instead of once per chunk
+            conn.execute("BEGIN")
+
+            # Indices are maintained per insert, so drop any leftovers from a
+            # previous run and recreate them once all rows are loaded
+            dropped_index_ddl = self._drop_existing_indices(conn)
+
+            # Create the table straight from the Arrow schema so every batch
+            # goes through the same insert path, with no first-chunk special
+            # case holding an extra materialized copy
+            self._create_table_from_schema(conn, schema)
+
+            # Prepare the INSERT once and reuse one cursor for the whole
+            # load; sqlite3 caches the prepared statement per cursor, so no
+            # chunk re-parses SQL or re-introspects the table
+            column_names = schema.names
+            placeholders = ",".join("?" * len(column_names))
+            quoted_columns = ",".join(f'"{name}"' for name in column_names)
+            insert_sql = f'INSERT INTO data_table ({quoted_columns}) VALUES ({placeholders})'
+            cursor = conn.cursor()
 
-            # Process remaining chunks
-            with tqdm(total=total_rows, initial=self.chunk_size) as pbar:
-                for df_chunk, _ in chunks_iterator:
+            # Process all chunks
+            with tqdm(total=total_rows, mininterval=0.5, smoothing=0.1) as pbar:
+                rows_since_refresh = 0
+                chunks_since_refresh = 0
+                for batch, _ in self._prefetch_chunks():
                     try:
-                        # Monitor memory
-                        mem_usage = self._get_memory_usage()
-                        self.logger.debug(f"Memory usage: {mem_usage:.2f}MB")
-
-                        # Append to SQLite
-                        df_chunk.to_sql(
-                            'data_table',
-                            conn,
-                            if_exists='append',
-                            index=False,
-                            method='multi'
-                        )
-
-                        # Update progress
-                        pbar.update(len(df_chunk))
-
-                        # Cleanup
-                        del df_chunk
-                        import gc
-                        gc.collect()
+                        # Memory polling costs a /proc read per chunk; only
+                        # pay it when debug logging is actually on
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"Memory usage: {self._get_memory_usage():.2f}MB")
+
+                        # Append to SQLite straight from the Arrow batch
+                        self._bulk_insert(cursor, insert_sql, batch)
+
+                        # Update progress coarsely; per-chunk updates take
+                        # the GIL and format a string even when not drawn
+                        rows_since_refresh += batch.num_rows
+                        chunks_since_refresh += 1
+                        if chunks_since_refresh >= self.PBAR_REFRESH_CHUNKS:
+                            pbar.update(rows_since_refresh)
+                            rows_since_refresh = 0
+                            chunks_since_refresh = 0
+
+                        # Arrow batches are freed by refcounting; no forced
+                        # gc.collect() needed per chunk
+                        del batch
 
                     except Exception as chunk_error:
                         self.logger.error(f"Error processing chunk: {str(chunk_error)}")
                         raise Exception(f"Chunk processing failed: {str(chunk_error)}") from chunk_error
 
-            # Create indices
+                if rows_since_refresh:
+                    pbar.update(rows_since_refresh)
+
+            # Recreate indices only after all rows are loaded
+            self._restore_indices(conn, dropped_index_ddl)
             self._create_indices(conn)
 
+            # Single commit for the whole ingest
+            conn.commit()
+
             self.logger.info("Conversion completed successfully")
 
         except Exception as e:
@@ -250,6 +899,85 @@ class ParquetToSQLiteConverter:
                 self.logger.debug("SQLite connection closed")
 
 
+def _ingest_row_groups(
+        input_file: str,
+        part_file: str,
+        row_group_ids: list,
+        chunk_size: int,
+        columns: Optional[list]
+) -> int:
+    """
+    Worker: ingest the given row groups into a standalone part database.
+
+    Runs in a separate process, so it must live at module level to be
+    picklable. Reuses the converter's single-writer fast path (bulk-load
+    PRAGMAs, one transaction, packed inserts) against its own SQLite file.
+
+    Args:
+        input_file: Path to the input Parquet file
+        part_file: Path of the part database to write
+        row_group_ids: Row groups of the Parquet file this worker owns
+        chunk_size: Number of rows to read per batch
+        columns: Subset of columns to load; None loads all columns
+
+    Returns:
+        Number of rows written to the part database
+    """
+    converter = ParquetToSQLiteConverter(
+        Path(input_file),
+        Path(part_file),
+        chunk_size,
+        logging.WARNING,
+        columns=columns
+    )
+
+    parquet_file = pq.ParquetFile(input_file, memory_map=True, pre_buffer=True)
+    batch_iterator = parquet_file.iter_batches(
+        batch_size=chunk_size,
+        row_groups=row_group_ids,
+        columns=columns
+    )
+
+    rows_written = 0
+    conn = converter._create_sqlite_connection()
+    try:
+        first_batch = next(batch_iterator, None)
+        if first_batch is None:
+            # A zero-row assignment (e.g. an empty row group) still needs
+            # data_table in the part, or the merge's INSERT ... SELECT
+            # would fail against an empty attached database
+            schema = parquet_file.schema_arrow
+            if columns is not None:
+                wanted = set(columns)
+                schema = pa.schema([field for field in schema if field.name in wanted])
+            conn.execute("BEGIN")
+            converter._create_table_from_schema(conn, schema)
+            conn.commit()
+            return 0
+
+        conn.execute("BEGIN")
+        # Derive DDL and INSERT from the batch schema so the column order
+        # always matches what iter_batches actually yields
+        converter._create_table_from_schema(conn, first_batch.schema)
+        column_names = first_batch.schema.names
+        placeholders = ",".join("?" * len(column_names))
+        quoted_columns = ",".join(f'"{name}"' for name in column_names)
+        insert_sql = f'INSERT INTO data_table ({quoted_columns}) VALUES ({placeholders})'
+        cursor = conn.cursor()
+
+        converter._bulk_insert(cursor, insert_sql, first_batch)
+        rows_written += first_batch.num_rows
+        for batch in batch_iterator:
+            converter._bulk_insert(cursor, insert_sql, batch)
+            rows_written += batch.num_rows
+
+        conn.commit()
+    finally:
+        conn.close()
+
+    return rows_written
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parse command line arguments.
@@ -288,6 +1016,35 @@ def parse_arguments() -> argparse.Namespace:
         help='Column name to create index on (e.g., domains)',
         default=None
     )
+    parser.add_argument(
+        '--use-adbc',
+        action='store_true',
+        help='Ingest through the ADBC SQLite driver (requires adbc-driver-sqlite)'
+    )
+    parser.add_argument(
+        '--columns',
+        type=str,
+        help='Comma-separated subset of columns to load (default: all columns)',
+        default=None
+    )
+    parser.add_argument(
+        '--fast-csv',
+        action='store_true',
+        help='Bulk load via CSV and the sqlite3 shell .import (clean datasets only)'
+    )
+    parser.add_argument(
+        '--integer-pk',
+        action='store_true',
+        help='Make an integer --index-column the PRIMARY KEY of a WITHOUT '
+             'ROWID table (values must be unique)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of processes to split the ingest across by row group '
+             '(default: 1, single writer)',
+        default=1
+    )
 
     return parser.parse_args()
 
@@ -304,6 +1061,7 @@ def main() -> Optional[NoReturn]:
     input_path = Path(args.input_file)
     output_path = Path(args.output if args.output else input_path.stem + '.db')
     log_level = logging.DEBUG if args.debug else logging.INFO
+    columns = args.columns.split(',') if args.columns else None
 
     try:
         converter = ParquetToSQLiteConverter(
@@ -311,7 +1069,12 @@ def main() -> Optional[NoReturn]:
             output_path,
             args.chunk_size,
             log_level,
-            args.index_column
+            args.index_column,
+            args.use_adbc,
+            columns,
+            args.fast_csv,
+            args.integer_pk,
+            args.workers
         )
         converter.convert()
     except Exception as e: